@@ -38,6 +38,25 @@ class APIBase(wtypes.Base):
     updated_at = wsme.wsattr(datetime.datetime, readonly=True)
     """The time in UTC at which the object is updated"""
 
+    _object_fields = {}
+    """The fields of the versioned object backing this API type"""
+
+    @classmethod
+    def _get_exposed_fields(cls):
+        """Return the fields of cls._object_fields that this type exposes.
+
+        Both inputs are class attributes, so the result is computed on first
+        use and cached on the class instead of being re-derived with hasattr
+        for every object converted in a listing.
+
+        """
+        exposed_fields = cls.__dict__.get('_exposed_fields')
+        if exposed_fields is None:
+            exposed_fields = tuple(field for field in cls._object_fields
+                                   if hasattr(cls, field))
+            cls._exposed_fields = exposed_fields
+        return exposed_fields
+
     def as_dict(self):
         """Render this object as a dict of its fields."""
         return {k: getattr(self, k)
@@ -156,15 +156,14 @@ class Bay(base.APIBase):
        nodes or not.
        """
 
+    _object_fields = objects.Cluster.fields
+
     def __init__(self, **kwargs):
         super(Bay, self).__init__()
 
-        self.fields = []
-        for field in objects.Cluster.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
         # Set the renamed attributes for bay backwards compatibility
@@ -221,9 +220,10 @@ class Bay(base.APIBase):
         return bay
 
     @classmethod
-    def convert_with_links(cls, rpc_bay, expand=True):
+    def convert_with_links(cls, rpc_bay, expand=True, host_url=None):
         bay = Bay(**rpc_bay.as_dict())
-        return cls._convert_with_links(bay, pecan.request.host_url, expand)
+        return cls._convert_with_links(bay, host_url or pecan.request.host_url,
+                                       expand)
 
     @classmethod
     def sample(cls, expand=True):
@@ -293,7 +293,8 @@ class BayCollection(collection.Collection):
     @staticmethod
     def convert_with_links(rpc_bays, limit, url=None, expand=False, **kwargs):
         collection = BayCollection()
-        collection.bays = [Bay.convert_with_links(p, expand)
+        host_url = pecan.request.host_url
+        collection.bays = [Bay.convert_with_links(p, expand, host_url)
                            for p in rpc_bays]
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
@@ -375,7 +376,7 @@ class BaysController(base.Controller):
                        action='bay:detail')
 
         # NOTE(lucasagomes): /detail should only work against collections
-        parent = pecan.request.path.split('/')[:-1][-1]
+        parent = pecan.request.path.rsplit('/', 2)[-2]
         if parent != "bays":
             raise exception.HTTPNotFound
 
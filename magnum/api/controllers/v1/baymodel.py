@@ -144,13 +144,12 @@ class BayModel(base.APIBase):
     tags = wtypes.StringType(min_length=0, max_length=255)
     """A comma separated list of tags."""
 
+    _object_fields = objects.ClusterTemplate.fields
+
     def __init__(self, **kwargs):
-        self.fields = []
-        for field in objects.ClusterTemplate.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
@@ -163,9 +162,10 @@ class BayModel(base.APIBase):
         return baymodel
 
     @classmethod
-    def convert_with_links(cls, rpc_baymodel):
+    def convert_with_links(cls, rpc_baymodel, host_url=None):
         baymodel = BayModel(**rpc_baymodel.as_dict())
-        return cls._convert_with_links(baymodel, pecan.request.host_url)
+        return cls._convert_with_links(baymodel,
+                                       host_url or pecan.request.host_url)
 
     @classmethod
     def sample(cls):
@@ -223,7 +223,8 @@ class BayModelCollection(collection.Collection):
     @staticmethod
     def convert_with_links(rpc_baymodels, limit, url=None, **kwargs):
         collection = BayModelCollection()
-        collection.baymodels = [BayModel.convert_with_links(p)
+        host_url = pecan.request.host_url
+        collection.baymodels = [BayModel.convert_with_links(p, host_url)
                                 for p in rpc_baymodels]
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
@@ -302,7 +303,7 @@ class BayModelsController(base.Controller):
                        action='baymodel:detail')
 
         # NOTE(lucasagomes): /detail should only work against collections
-        parent = pecan.request.path.split('/')[:-1][-1]
+        parent = pecan.request.path.rsplit('/', 2)[-2]
         if parent != "baymodels":
             raise exception.HTTPNotFound
 
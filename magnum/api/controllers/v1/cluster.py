@@ -185,14 +185,13 @@ class Cluster(base.APIBase):
        nodes or not.
        """
 
+    _object_fields = objects.Cluster.fields
+
     def __init__(self, **kwargs):
         super(Cluster, self).__init__()
-        self.fields = []
-        for field in objects.Cluster.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
         nodegroup_fields = ['node_count', 'master_count',
                             'node_addresses', 'master_addresses']
@@ -224,11 +223,12 @@ class Cluster(base.APIBase):
         return cluster
 
     @classmethod
-    def convert_with_links(cls, rpc_cluster, expand=True):
+    def convert_with_links(cls, rpc_cluster, expand=True, host_url=None):
         cluster = Cluster(**rpc_cluster.as_dict())
         parent_labels = rpc_cluster.cluster_template.labels
-        return cls._convert_with_links(cluster, pecan.request.host_url, expand,
-                                       parent_labels)
+        return cls._convert_with_links(cluster,
+                                       host_url or pecan.request.host_url,
+                                       expand, parent_labels)
 
     @classmethod
     def sample(cls, expand=True):
@@ -290,7 +290,8 @@ class ClusterCollection(collection.Collection):
     def convert_with_links(rpc_clusters, limit, url=None, expand=False,
                            **kwargs):
         collection = ClusterCollection()
-        collection.clusters = [Cluster.convert_with_links(p, expand)
+        host_url = pecan.request.host_url
+        collection.clusters = [Cluster.convert_with_links(p, expand, host_url)
                                for p in rpc_clusters]
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
@@ -400,7 +401,7 @@ class ClustersController(base.Controller):
                        action='cluster:detail')
 
         # NOTE(lucasagomes): /detail should only work against collections
-        parent = pecan.request.path.split('/')[:-1][-1]
+        parent = pecan.request.path.rsplit('/', 2)[-2]
         if parent != "clusters":
             raise exception.HTTPNotFound
 
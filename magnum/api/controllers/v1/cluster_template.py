@@ -159,13 +159,12 @@ class ClusterTemplate(base.APIBase):
     tags = wtypes.StringType(min_length=0, max_length=255)
     """A comma separated list of tags."""
 
+    _object_fields = objects.ClusterTemplate.fields
+
     def __init__(self, **kwargs):
-        self.fields = []
-        for field in objects.ClusterTemplate.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
@@ -180,10 +179,10 @@ class ClusterTemplate(base.APIBase):
         return cluster_template
 
     @classmethod
-    def convert_with_links(cls, rpc_cluster_template):
+    def convert_with_links(cls, rpc_cluster_template, host_url=None):
         cluster_template = ClusterTemplate(**rpc_cluster_template.as_dict())
         return cls._convert_with_links(cluster_template,
-                                       pecan.request.host_url)
+                                       host_url or pecan.request.host_url)
 
     @classmethod
     def sample(cls):
@@ -240,8 +239,10 @@ class ClusterTemplateCollection(collection.Collection):
     @staticmethod
     def convert_with_links(rpc_cluster_templates, limit, url=None, **kwargs):
         collection = ClusterTemplateCollection()
-        collection.clustertemplates = [ClusterTemplate.convert_with_links(p)
-                                       for p in rpc_cluster_templates]
+        host_url = pecan.request.host_url
+        collection.clustertemplates = [
+            ClusterTemplate.convert_with_links(p, host_url)
+            for p in rpc_cluster_templates]
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -346,7 +347,7 @@ class ClusterTemplatesController(base.Controller):
                        action='clustertemplate:detail')
 
         # NOTE(lucasagomes): /detail should only work against collections
-        parent = pecan.request.path.split('/')[:-1][-1]
+        parent = pecan.request.path.rsplit('/', 2)[-2]
         if parent != "clustertemplates":
             raise exception.HTTPNotFound
 
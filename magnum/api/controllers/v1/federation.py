@@ -84,14 +84,13 @@ class Federation(base.APIBase):
     # A list containing a self link and associated federations links
     links = wsme.wsattr([link.Link], readonly=True)
 
+    _object_fields = objects.Federation.fields
+
     def __init__(self, **kwargs):
         super(Federation, self).__init__()
-        self.fields = []
-        for field in objects.Federation.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
@@ -109,9 +108,10 @@ class Federation(base.APIBase):
         return federation
 
     @classmethod
-    def convert_with_links(cls, rpc_federation, expand=True):
+    def convert_with_links(cls, rpc_federation, expand=True, host_url=None):
         federation = Federation(**rpc_federation.as_dict())
-        return cls._convert_with_links(federation, pecan.request.host_url,
+        return cls._convert_with_links(federation,
+                                       host_url or pecan.request.host_url,
                                        expand)
 
     @classmethod
@@ -154,8 +154,10 @@ class FederationCollection(collection.Collection):
     def convert_with_links(rpc_federation, limit, url=None, expand=False,
                            **kwargs):
         collection = FederationCollection()
-        collection.federations = [Federation.convert_with_links(p, expand)
-                                  for p in rpc_federation]
+        host_url = pecan.request.host_url
+        collection.federations = [
+            Federation.convert_with_links(p, expand, host_url)
+            for p in rpc_federation]
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -236,7 +238,7 @@ class FederationsController(base.Controller):
                        action='federation:detail')
 
         # NOTE(lucasagomes): /detail should only work against collections
-        parent = pecan.request.path.split('/')[:-1][-1]
+        parent = pecan.request.path.rsplit('/', 2)[-2]
         if parent != "federations":
             raise exception.HTTPNotFound
 
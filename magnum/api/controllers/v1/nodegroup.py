@@ -144,19 +144,18 @@ class NodeGroup(base.APIBase):
                 wtypes.text, six.integer_types, bool, float))
     """Contains labels that exist in the parent but were not inherited."""
 
+    _object_fields = objects.NodeGroup.fields
+
     def __init__(self, **kwargs):
         super(NodeGroup, self).__init__()
-        self.fields = []
-        for field in objects.NodeGroup.fields:
-            # Skip fields we do not expose.
-            if not hasattr(self, field):
-                continue
-            self.fields.append(field)
+        exposed_fields = self._get_exposed_fields()
+        self.fields = list(exposed_fields)
+        for field in exposed_fields:
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @classmethod
-    def convert(cls, nodegroup, expand=True):
-        url = pecan.request.host_url
+    def convert(cls, nodegroup, expand=True, host_url=None):
+        url = host_url or pecan.request.host_url
         cluster_path = 'clusters/%s' % nodegroup.cluster_id
         nodegroup_path = 'nodegroups/%s' % nodegroup.uuid
 
@@ -208,7 +207,8 @@ class NodeGroupCollection(collection.Collection):
     @staticmethod
     def convert(nodegroups, cluster_id, limit, expand=True, **kwargs):
         collection = NodeGroupCollection()
-        collection.nodegroups = [NodeGroup.convert(ng, expand)
+        host_url = pecan.request.host_url
+        collection.nodegroups = [NodeGroup.convert(ng, expand, host_url)
                                  for ng in nodegroups]
         url = "clusters/%s/nodegroups" % cluster_id
         collection.next = collection.get_next(limit,
@@ -60,18 +60,22 @@ def get(url, allowed_schemes=('http', 'https')):
         # engine.  The 'Content-Length' header could be faked, so it's
         # necessary to download the content in chunks to until
         # max_manifest_size is reached.  The chunk_size we use needs
-        # to balance CPU-intensive string concatenation with accuracy
-        # (eg. it's possible to fetch 1000 bytes greater than
-        # max_manifest_size with a chunk_size of 1000).
+        # to balance per-chunk overhead with accuracy (eg. it's possible
+        # to fetch 1000 bytes greater than max_manifest_size with a
+        # chunk_size of 1000).  Chunks are collected in a list and joined
+        # once at the end, so the download stays linear in its size
+        # instead of copying the whole result on every chunk.
         reader = resp.iter_content(chunk_size=1000)
-        result = ""
+        chunks = []
+        size = 0
         for chunk in reader:
-            result += chunk
-            if len(result) > CONF.max_manifest_size:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > CONF.max_manifest_size:
                 raise URLFetchError("Manifest exceeds maximum allowed "
                                     "size (%s bytes)" %
                                     CONF.max_manifest_size)
-        return result
+        return "".join(chunks)
 
     except exceptions.RequestException as ex:
         raise URLFetchError(_('Failed to retrieve manifest: %s') % ex)
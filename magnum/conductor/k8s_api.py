@@ -28,7 +28,10 @@ class KubernetesAPI:
     Also, our interactions with the Kubernetes API are happening inside
     Greenthreads so we don't need to use connection pooling on top of it,
     in addition to pools not being something that you can disable with
-    the native Kubernetes API.
+    the native Kubernetes API. Each instance does however keep a single
+    `requests.Session` so that the calls made while polling a cluster
+    (e.g. /healthz followed by /api/v1/nodes) reuse the same TLS
+    connection instead of handshaking with the API server every time.
     """
 
     def __init__(self, context, cluster):
@@ -40,8 +43,14 @@ class KubernetesAPI:
             self.cluster, self.context
         )
 
+        self.session = requests.Session()
+
     def _request(self, method, url, json=True):
-        response = requests.request(
+        # NOTE: verify and cert are passed per request rather than set on
+        # the session, since requests lets REQUESTS_CA_BUNDLE and
+        # CURL_CA_BUNDLE override a session-level verify, which would make
+        # us check the cluster's API certificate against the system bundle.
+        response = self.session.request(
             method,
             url,
             verify=self.ca_file.name,
@@ -89,6 +98,8 @@ class KubernetesAPI:
 
         TODO(mnaser): Use a context manager and avoid having these here.
         """
+        if hasattr(self, 'session'):
+            self.session.close()
         if hasattr(self, 'ca_file'):
             self.ca_file.close()
         if hasattr(self, 'cert_file'):
@@ -482,6 +482,17 @@ class FedoraKubernetesDriver(KubernetesDriver):
 
 class HeatPoller(object):
 
+    # The status a nodegroup is moved to when its stack is not found in
+    # Heat, keyed by the status the nodegroup had at that point.
+    missing_stack_status = {
+        fields.ClusterStatus.DELETE_IN_PROGRESS:
+            fields.ClusterStatus.DELETE_COMPLETE,
+        fields.ClusterStatus.CREATE_IN_PROGRESS:
+            fields.ClusterStatus.CREATE_FAILED,
+        fields.ClusterStatus.UPDATE_IN_PROGRESS:
+            fields.ClusterStatus.UPDATE_FAILED,
+    }
+
     def __init__(self, openstack_client, context, cluster, cluster_driver):
         self.openstack_client = openstack_client
         self.context = context
@@ -574,7 +585,8 @@ class HeatPoller(object):
         DELETE = 'DELETE'
 
         previous_state = self.cluster.status
-        self.cluster.status_reason = None
+        status = previous_state
+        status_reason = None
 
         non_default_ngs_exist = any(not ns.is_default for ns in ng_statuses)
         # Both default nodegroups will have the same status so it's
@@ -592,10 +604,9 @@ class HeatPoller(object):
                     # If there are no non-default NGs
                     # just use the default NG's status.
                     status = default_ng_status
-                self.cluster.status = status
                 break
 
-        if self.cluster.status == fields.ClusterStatus.CREATE_COMPLETE:
+        if status == fields.ClusterStatus.CREATE_COMPLETE:
             # Consider the scenario where the user:
             # - creates the cluster (cluster: create_complete)
             # - adds a nodegroup (cluster: update_complete)
@@ -605,16 +616,25 @@ class HeatPoller(object):
             # cases, just go to UPDATE_COMPLETE.
             if previous_state not in (fields.ClusterStatus.CREATE_COMPLETE,
                                       fields.ClusterStatus.CREATE_IN_PROGRESS):
-                self.cluster.status = fields.ClusterStatus.UPDATE_COMPLETE
+                status = fields.ClusterStatus.UPDATE_COMPLETE
 
         # Summarize the failed reasons.
-        if self.cluster.status.endswith(FAILED):
+        if status.endswith(FAILED):
             reasons = ["%s failed" % (ns.name)
                        for ns in ng_statuses
                        if ns.status.endswith(FAILED)]
-            self.cluster.status_reason = ', '.join(reasons)
-
-        self.cluster.save()
+            status_reason = ', '.join(reasons)
+
+        # NOTE: Assigning a field marks it as changed even if the value is
+        # the same, so only touch the fields that actually differ. Clusters
+        # stay IN_PROGRESS for many polls and there is no point in writing
+        # the same row back to the DB every time.
+        if self.cluster.status != status:
+            self.cluster.status = status
+        if self.cluster.status_reason != status_reason:
+            self.cluster.status_reason = status_reason
+        if self.cluster.obj_what_changed():
+            self.cluster.save()
 
     def _delete_complete(self):
         LOG.info('Cluster has been deleted, stack_id: %s',
@@ -668,14 +688,13 @@ class HeatPoller(object):
                    'reason': self.nodegroup.status_reason})
 
     def _sync_missing_heat_stack(self):
-        if self.nodegroup.status == fields.ClusterStatus.DELETE_IN_PROGRESS:
-            self._sync_missing_stack(fields.ClusterStatus.DELETE_COMPLETE)
-            if self.nodegroup.is_default:
-                self._check_delete_complete()
-        elif self.nodegroup.status == fields.ClusterStatus.CREATE_IN_PROGRESS:
-            self._sync_missing_stack(fields.ClusterStatus.CREATE_FAILED)
-        elif self.nodegroup.status == fields.ClusterStatus.UPDATE_IN_PROGRESS:
-            self._sync_missing_stack(fields.ClusterStatus.UPDATE_FAILED)
+        new_status = self.missing_stack_status.get(self.nodegroup.status)
+        if new_status is None:
+            return
+        self._sync_missing_stack(new_status)
+        if (new_status == fields.ClusterStatus.DELETE_COMPLETE and
+                self.nodegroup.is_default):
+            self._check_delete_complete()
 
     def _check_delete_complete(self):
         default_ng_statuses = [ng.status for ng in self.default_ngs]
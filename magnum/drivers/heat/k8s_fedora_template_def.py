@@ -29,6 +29,16 @@ CONF = cfg.CONF
 
 LOG = logging.getLogger(__name__)
 
+# NOTE: The built-in policy is a constant, serialize it once at import
+# rather than parsing a JSON literal every time a cluster is created.
+DEFAULT_KEYSTONE_AUTH_POLICY = json.dumps(
+    [{"resource": {"verbs": ["list"],
+                   "resources": ["pods", "services", "deployments", "pvc"],
+                   "version": "*", "namespace": "default"},
+      "match": [{"type": "role", "values": ["member"]},
+                {"type": "project", "values": ["$PROJECT_ID"]}]}],
+    sort_keys=True)
+
 
 class K8sFedoraTemplateDefinition(k8s_template_def.K8sTemplateDefinition):
     """Kubernetes template for a Fedora."""
@@ -184,12 +194,6 @@ class K8sFedoraTemplateDefinition(k8s_template_def.K8sTemplateDefinition):
         # this. This function can be extracted to k8s_template_def.py if k8s
         # keystone auth feature is adopted by other drivers.
 
-        default_policy = """[{"resource": {"verbs": ["list"],
-            "resources": ["pods", "services", "deployments", "pvc"],
-            "version": "*", "namespace": "default"},
-            "match": [{"type": "role","values": ["member"]},
-            {"type": "project", "values": ["$PROJECT_ID"]}]}]"""
-
         keystone_auth_enabled = extra_params.get("keystone_auth_enabled",
                                                  "True")
         if strutils.bool_from_string(keystone_auth_enabled):
@@ -198,8 +202,7 @@ class K8sFedoraTemplateDefinition(k8s_template_def.K8sTemplateDefinition):
                     default_policy = json.dumps(json.loads(f.read()))
             except Exception:
                 LOG.error("Failed to load default keystone auth policy")
-                default_policy = json.dumps(json.loads(default_policy),
-                                            sort_keys=True)
+                default_policy = DEFAULT_KEYSTONE_AUTH_POLICY
 
             washed_policy = default_policy.replace('"', '\"') \
                 .replace("$PROJECT_ID", extra_params["project_id"])
@@ -18,13 +18,11 @@ from magnum.drivers.k8s_coreos_v1 import template_def
 
 class Driver(driver.KubernetesDriver):
 
-    @property
-    def provides(self):
-        return [
-            {'server_type': 'vm',
-             'os': 'coreos',
-             'coe': 'kubernetes'},
-        ]
+    provides = [
+        {'server_type': 'vm',
+         'os': 'coreos',
+         'coe': 'kubernetes'},
+    ]
 
     def get_template_definition(self):
         return template_def.CoreOSK8sTemplateDefinition()
@@ -19,6 +19,10 @@ from magnum.drivers.heat import k8s_coreos_template_def as kctd
 CONF = magnum.conf.CONF
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/kubecluster.yaml')
+
+
 class CoreOSK8sTemplateDefinition(kctd.CoreOSK8sTemplateDefinition):
     """Kubernetes template for a CoreOS Container Linux VM."""
 
@@ -28,5 +32,4 @@ class CoreOSK8sTemplateDefinition(kctd.CoreOSK8sTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/kubecluster.yaml')
+        return TEMPLATE_PATH
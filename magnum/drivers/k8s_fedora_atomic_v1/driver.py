@@ -22,13 +22,11 @@ LOG = logging.getLogger(__name__)
 
 class Driver(driver.FedoraKubernetesDriver):
 
-    @property
-    def provides(self):
-        return [
-            {'server_type': 'vm',
-             'os': 'fedora-atomic',
-             'coe': 'kubernetes'},
-        ]
+    provides = [
+        {'server_type': 'vm',
+         'os': 'fedora-atomic',
+         'coe': 'kubernetes'},
+    ]
 
     def get_template_definition(self):
         return template_def.AtomicK8sTemplateDefinition()
@@ -20,6 +20,10 @@ from magnum.drivers.heat import k8s_fedora_template_def as kftd
 CONF = magnum.conf.CONF
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/kubecluster.yaml')
+
+
 class AtomicK8sTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
     """Kubernetes template for a Fedora Atomic VM."""
 
@@ -29,5 +33,4 @@ class AtomicK8sTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/kubecluster.yaml')
+        return TEMPLATE_PATH
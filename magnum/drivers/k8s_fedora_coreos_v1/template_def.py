@@ -22,6 +22,10 @@ from magnum.drivers.heat import k8s_fedora_template_def as kftd
 CONF = magnum.conf.CONF
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/kubecluster.yaml')
+
+
 class FCOSK8sTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
     """Kubernetes template for a Fedora Atomic VM."""
 
@@ -31,8 +35,7 @@ class FCOSK8sTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/kubecluster.yaml')
+        return TEMPLATE_PATH
 
     def get_params(self, context, cluster_template, cluster, **kwargs):
         extra_params = super(FCOSK8sTemplateDefinition,
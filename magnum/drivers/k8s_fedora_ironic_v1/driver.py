@@ -18,13 +18,11 @@ from magnum.drivers.k8s_fedora_ironic_v1 import template_def
 
 class Driver(driver.KubernetesDriver):
 
-    @property
-    def provides(self):
-        return [
-            {'server_type': 'bm',
-             'os': 'fedora',
-             'coe': 'kubernetes'},
-        ]
+    provides = [
+        {'server_type': 'bm',
+         'os': 'fedora',
+         'coe': 'kubernetes'},
+    ]
 
     def get_template_definition(self):
         return template_def.FedoraK8sIronicTemplateDefinition()
@@ -21,6 +21,10 @@ from oslo_config import cfg
 CONF = cfg.CONF
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/kubecluster.yaml')
+
+
 class FedoraK8sIronicTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
     """Kubernetes template for a Fedora Baremetal."""
 
@@ -71,5 +75,4 @@ class FedoraK8sIronicTemplateDefinition(kftd.K8sFedoraTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/kubecluster.yaml')
+        return TEMPLATE_PATH
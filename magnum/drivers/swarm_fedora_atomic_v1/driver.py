@@ -19,13 +19,11 @@ from magnum.drivers.swarm_fedora_atomic_v1 import template_def
 
 class Driver(driver.HeatDriver):
 
-    @property
-    def provides(self):
-        return [
-            {'server_type': 'vm',
-             'os': 'fedora-atomic',
-             'coe': 'swarm'},
-        ]
+    provides = [
+        {'server_type': 'vm',
+         'os': 'fedora-atomic',
+         'coe': 'swarm'},
+    ]
 
     def get_template_definition(self):
         return template_def.AtomicSwarmTemplateDefinition()
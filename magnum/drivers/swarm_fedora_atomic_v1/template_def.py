@@ -16,6 +16,10 @@ import os
 from magnum.drivers.heat import swarm_fedora_template_def as sftd
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/cluster.yaml')
+
+
 class AtomicSwarmTemplateDefinition(sftd.SwarmFedoraTemplateDefinition):
     """Docker swarm template for a Fedora Atomic VM."""
 
@@ -25,5 +29,4 @@ class AtomicSwarmTemplateDefinition(sftd.SwarmFedoraTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/cluster.yaml')
+        return TEMPLATE_PATH
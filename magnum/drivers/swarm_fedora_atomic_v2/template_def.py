@@ -16,6 +16,10 @@ import os
 from magnum.drivers.heat import swarm_mode_template_def as sftd
 
 
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             'templates/swarmcluster.yaml')
+
+
 class AtomicSwarmTemplateDefinition(sftd.SwarmModeTemplateDefinition):
     """Docker swarm template for a Fedora Atomic VM."""
 
@@ -25,8 +29,7 @@ class AtomicSwarmTemplateDefinition(sftd.SwarmModeTemplateDefinition):
 
     @property
     def template_path(self):
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                            'templates/swarmcluster.yaml')
+        return TEMPLATE_PATH
 
     def get_params(self, context, cluster_template, cluster, **kwargs):
         ep = kwargs.pop('extra_params', {})
@@ -13,6 +13,7 @@
 from unittest import mock
 
 from webob import exc
+from wsme import types as wtypes
 
 from magnum.api.controllers import base
 from magnum.api.controllers import versions
@@ -225,6 +226,38 @@ class TestVersion(test_base.TestCase):
             'container-infra 1.1')
 
 
+class TestAPIBase(test_base.TestCase):
+    def test_get_exposed_fields(self):
+        class FakeAPIType(base.APIBase):
+            _object_fields = ['uuid', 'name', 'secret', 'created_at']
+            uuid = wtypes.text
+            name = wtypes.text
+
+        self.assertEqual(('uuid', 'name', 'created_at'),
+                         FakeAPIType._get_exposed_fields())
+        # The result is cached on the class and reused afterwards.
+        self.assertEqual(('uuid', 'name', 'created_at'),
+                         FakeAPIType.__dict__['_exposed_fields'])
+        self.assertIs(FakeAPIType._exposed_fields,
+                      FakeAPIType._get_exposed_fields())
+        self.assertNotIn('_exposed_fields', base.APIBase.__dict__)
+
+    def test_get_exposed_fields_per_class(self):
+        class FakeAPIType(base.APIBase):
+            _object_fields = ['uuid', 'name']
+            uuid = wtypes.text
+            name = wtypes.text
+
+        class FakeSubAPIType(FakeAPIType):
+            _object_fields = ['uuid']
+
+        self.assertEqual(('uuid', 'name'), FakeAPIType._get_exposed_fields())
+        # The cache is keyed on the class, and each class reads its own
+        # _object_fields, so a subclass never sees its parent's result.
+        self.assertEqual(('uuid',), FakeSubAPIType._get_exposed_fields())
+        self.assertEqual(('uuid', 'name'), FakeAPIType._get_exposed_fields())
+
+
 class TestController(test_base.TestCase):
     def test_check_for_versions_intersection_negative(self):
         func_list = \
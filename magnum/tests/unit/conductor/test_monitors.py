@@ -16,6 +16,8 @@
 import tempfile
 from unittest import mock
 
+import fixtures
+import requests
 from requests_mock.contrib import fixture
 
 from magnum.common import exception
@@ -389,6 +391,54 @@ class MonitorsTestCase(base.TestCase):
         self.assertEqual(self.k8s_monitor.data['health_status_reason'],
                          {'api': 'ok', 'k8s-cluster-node-0.Ready': True})
 
+    def _register_k8s_health_uris(self):
+        self.requests_mock.register_uri(
+            'GET',
+            f"{self.cluster.api_address}/api/v1/nodes",
+            json={'items': []}
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            f"{self.cluster.api_address}/healthz",
+            text="ok",
+        )
+
+    @mock.patch('magnum.conductor.k8s_api.create_client_files')
+    def test_k8s_monitor_health_uses_cluster_ca(self,
+                                                mock_create_client_files):
+        ca_file, key_file, cert_file = (tempfile.NamedTemporaryFile(),
+                                        tempfile.NamedTemporaryFile(),
+                                        tempfile.NamedTemporaryFile())
+        mock_create_client_files.return_value = (ca_file, key_file, cert_file)
+        self.useFixture(fixtures.EnvironmentVariable(
+            'REQUESTS_CA_BUNDLE', '/etc/ssl/certs/ca-certificates.crt'))
+        self._register_k8s_health_uris()
+
+        self.k8s_monitor.poll_health_status()
+
+        self.assertEqual(2, len(self.requests_mock.request_history))
+        for request in self.requests_mock.request_history:
+            self.assertEqual(ca_file.name, request.verify)
+            self.assertEqual((cert_file.name, key_file.name), request.cert)
+
+    @mock.patch('magnum.conductor.k8s_api.create_client_files')
+    def test_k8s_monitor_health_reuses_session(self,
+                                               mock_create_client_files):
+        mock_create_client_files.return_value = (
+            tempfile.NamedTemporaryFile(),
+            tempfile.NamedTemporaryFile(),
+            tempfile.NamedTemporaryFile()
+        )
+        self._register_k8s_health_uris()
+
+        with mock.patch.object(requests.Session, 'request', autospec=True,
+                               side_effect=requests.Session.request) as req:
+            self.k8s_monitor.poll_health_status()
+
+        self.assertEqual(2, req.call_count)
+        sessions = {id(call[0][0]) for call in req.call_args_list}
+        self.assertEqual(1, len(sessions))
+
     @mock.patch('magnum.conductor.k8s_api.create_client_files')
     def test_k8s_monitor_health_unhealthy_api(self, mock_create_client_files):
         mock_create_client_files.return_value = (
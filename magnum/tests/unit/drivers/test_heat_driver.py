@@ -148,6 +148,62 @@ class TestHeatPoller(base.TestCase):
         self.assertEqual(cluster_status.CREATE_IN_PROGRESS, cluster.status)
         self.assertEqual(1, cluster.save.call_count)
 
+    def _setup_real_cluster(self, poller, **kwargs):
+        # Use a real Cluster object so that obj_what_changed() reflects
+        # the fields the poller actually assigns.
+        cluster_dict = utils.get_test_cluster(**kwargs)
+        cluster = objects.Cluster(self.context, **cluster_dict)
+        cluster.obj_reset_changes()
+        poller.cluster = cluster
+        self.def_ngs[1].status = cluster.status
+        p = mock.patch.object(objects.Cluster, 'default_ng_master',
+                              new_callable=mock.PropertyMock,
+                              return_value=self.def_ngs[1])
+        p.start()
+        self.addCleanup(p.stop)
+        p = mock.patch.object(objects.Cluster, 'save')
+        mock_save = p.start()
+        self.addCleanup(p.stop)
+        return cluster, mock_save
+
+    def test_aggregate_nodegroup_statuses_unchanged(self):
+        _, poller = self.setup_poll_test(
+            default_stack_status=cluster_status.CREATE_IN_PROGRESS)
+        cluster, mock_save = self._setup_real_cluster(
+            poller, status=cluster_status.CREATE_IN_PROGRESS,
+            status_reason=None)
+        ng_statuses = [
+            heat_driver.NodeGroupStatus(
+                name=ng.name, status=cluster_status.CREATE_IN_PROGRESS,
+                reason=None, is_default=True)
+            for ng in self.def_ngs]
+
+        poller.aggregate_nodegroup_statuses(ng_statuses)
+
+        self.assertEqual(cluster_status.CREATE_IN_PROGRESS, cluster.status)
+        self.assertIsNone(cluster.status_reason)
+        self.assertEqual(set(), cluster.obj_what_changed())
+        self.assertEqual(0, mock_save.call_count)
+
+    def test_aggregate_nodegroup_statuses_reason_changed(self):
+        _, poller = self.setup_poll_test(
+            default_stack_status=cluster_status.CREATE_IN_PROGRESS)
+        cluster, mock_save = self._setup_real_cluster(
+            poller, status=cluster_status.CREATE_IN_PROGRESS,
+            status_reason='old reason')
+        ng_statuses = [
+            heat_driver.NodeGroupStatus(
+                name=ng.name, status=cluster_status.CREATE_IN_PROGRESS,
+                reason=None, is_default=True)
+            for ng in self.def_ngs]
+
+        poller.aggregate_nodegroup_statuses(ng_statuses)
+
+        self.assertEqual(cluster_status.CREATE_IN_PROGRESS, cluster.status)
+        self.assertIsNone(cluster.status_reason)
+        self.assertEqual({'status_reason'}, cluster.obj_what_changed())
+        self.assertEqual(1, mock_save.call_count)
+
     def test_poll_and_check_create_complete(self):
         cluster, poller = self.setup_poll_test()
 